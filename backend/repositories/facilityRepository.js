@@ -17,6 +17,7 @@ class FacilityRepository {
       name_en,
       amenity, 
       healthcare, 
+      healthca_1,
       building, 
       addr_city, 
       addr_full, 
@@ -26,6 +26,7 @@ export interface HealthFacilityResponse {
   name_en?: string;
   amenity?: string;
   healthcare?: string;
+  healthca_1?: string;
   building?: string;
   addr_city?: string;
   addr_full?: string;
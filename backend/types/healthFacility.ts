@@ -32,6 +32,7 @@ export interface HealthFacilityResponse {
   name_en?: string | null;
   amenity?: string | null;      // Can be from AmenityType enum or other values
   healthcare?: string | null;   // Can be from HealthcareType enum or other values
+  healthca_1?: string | null;
   building?: string | null;     // Can be from BuildingType enum or other values
   addr_city?: string | null;
   addr_full?: string | null;
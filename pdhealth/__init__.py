@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+pdhealth - CLI gộp các script tạo dữ liệu cho PD Health
+
+Cách dùng (chạy từ thư mục gốc repo):
+    python -m pdhealth onboard                 # tạo + xác thực bác sĩ
+    python -m pdhealth schedule --yes          # tạo lịch cho bác sĩ
+    python -m pdhealth verify                  # kiểm tra lịch bằng digest
+    python -m pdhealth list                    # liệt kê bác sĩ trong hệ thống
+    python -m pdhealth export                  # xuất cơ sở y tế ra JSON
+    python -m pdhealth upload-facilities       # upload cơ sở y tế theo batch
+    python -m pdhealth batch jobs.txt          # chạy nhiều lệnh trong 1 process
+
+Module này chỉ import thư viện chuẩn nhẹ; requests và các subcommand
+chỉ được import khi thực sự chạy subcommand đó.
+"""
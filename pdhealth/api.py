@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP client dùng chung cho các subcommand
+
+requests chỉ được import ở lần gọi API đầu tiên; mọi subcommand trong cùng
+process (kể cả chế độ batch) dùng chung 1 Session, tức 1 connection pool,
+và dùng lại token đã đăng nhập.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from pdhealth.config import Config
+
+_session = None
+_tokens: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
+
+def get_session():
+    """Tạo (lần đầu) và trả về requests.Session dùng chung"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def request(config: Config, method: str, path: str, token: Optional[str] = None, **kwargs):
+    """Gọi API tại config.base_url + path, tự thêm timeout và header Authorization"""
+    headers = kwargs.pop("headers", {})
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    kwargs.setdefault("timeout", config.timeout)
+    return get_session().request(method, f"{config.base_url}{path}", headers=headers, **kwargs)
+
+
+def has_cached_token(config: Config, email: str) -> bool:
+    """Token của email này đã có trong cache chưa (login sẽ không gửi request)"""
+    return (config.base_url, email) in _tokens
+
+
+def login(config: Config, email: str, password: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Đăng nhập và lấy token (có cache theo base_url + email)
+    Returns: (token, user_id)
+    """
+    key = (config.base_url, email)
+    if key in _tokens:
+        return _tokens[key]
+
+    try:
+        response = request(config, "POST", "/auth/login", json={"email": email, "password": password})
+
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("success"):
+                token = data.get("data", {}).get("token")
+                user_id = data.get("data", {}).get("user", {}).get("id")
+                _tokens[key] = (token, user_id)
+                return token, user_id
+
+        print(f"    ✗ Đăng nhập thất bại ({email}): {response.status_code} - {response.text[:100]}")
+        return None, None
+
+    except Exception as e:
+        print(f"    ✗ Lỗi đăng nhập ({email}): {str(e)}")
+        return None, None
+
+
+def login_admin(config: Config) -> Optional[str]:
+    """Đăng nhập admin theo cấu hình và lấy token"""
+    token, _ = login(config, config.admin_email, config.admin_password)
+    return token
+
+
+def print_section(title: str):
+    """In tiêu đề section"""
+    print("\n" + "=" * 70)
+    print(f"  {title}")
+    print("=" * 70)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Điểm vào của lệnh pdhealth
+
+Mỗi subcommand là 1 module trong pdhealth.commands với 2 hàm:
+  - add_arguments(parser): khai báo tham số riêng
+  - run(args, config) -> int: chạy và trả về exit code
+Module chỉ được import khi subcommand đó được gọi, nên `--help` hay một
+lệnh ngắn không phải trả chi phí import requests và các subcommand khác.
+"""
+
+import argparse
+import importlib
+import shlex
+import sys
+from typing import List, Optional
+
+from pdhealth.config import ENVIRONMENTS, load_config
+
+# Tên subcommand -> (module, mô tả)
+COMMANDS = {
+    "onboard": ("pdhealth.commands.onboard", "Đăng ký, tạo profile và xác thực bác sĩ"),
+    "schedule": ("pdhealth.commands.schedule", "Tạo lịch làm việc hàng ngày cho bác sĩ"),
+    "verify": ("pdhealth.commands.verify", "Kiểm tra lịch bác sĩ bằng digest theo ngày"),
+    "list": ("pdhealth.commands.list_doctors", "Liệt kê bác sĩ trong hệ thống (cần admin)"),
+    "upload-facilities": ("pdhealth.commands.upload_facilities", "Upload cơ sở y tế theo batch (cần admin)"),
+    "export": ("pdhealth.commands.export", "Xuất cơ sở y tế ra file JSON"),
+}
+
+
+def add_global_arguments(parser: argparse.ArgumentParser):
+    """Tùy chọn chung cho mọi subcommand (môi trường, BASE_URL, file cấu hình)"""
+    parser.add_argument("--env", help=f"Môi trường ({', '.join(ENVIRONMENTS)} hoặc khai báo trong file cấu hình)")
+    parser.add_argument("--base-url", help="Ghi đè BASE_URL của môi trường")
+    parser.add_argument("--config", help="Đường dẫn file cấu hình JSON (mặc định ./pdhealth.json)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser cấp cao nhất: tùy chọn chung + tên subcommand"""
+    epilog = "Subcommands:\n" + "\n".join(
+        f"  {name:<20}{description}" for name, (_, description) in COMMANDS.items()
+    ) + f"\n  {'batch':<20}Chạy nhiều subcommand (mỗi dòng 1 lệnh) trong cùng 1 process"
+
+    parser = argparse.ArgumentParser(
+        prog="pdhealth",
+        description="Công cụ tạo dữ liệu cho PD Health",
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    add_global_arguments(parser)
+    parser.add_argument("command", metavar="command", choices=[*COMMANDS, "batch"], help="Tên subcommand")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Tham số của subcommand")
+    return parser
+
+
+def run_command(name: str, argv: List[str], config) -> int:
+    """Import lười module của subcommand, parse tham số riêng và chạy"""
+    if name not in COMMANDS:
+        print(f"✗ Subcommand không hợp lệ: {name}")
+        return 2
+
+    module_name, description = COMMANDS[name]
+    module = importlib.import_module(module_name)
+
+    parser = argparse.ArgumentParser(prog=f"pdhealth {name}", description=description)
+    module.add_arguments(parser)
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return e.code or 0
+
+    # Lỗi của 1 subcommand không được làm dừng cả batch
+    try:
+        return module.run(args, config) or 0
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 2
+    except OSError as e:
+        print(f"✗ Lỗi file/kết nối: {e}")
+        return 1
+    except Exception as e:
+        print(f"✗ Lỗi không mong muốn ({type(e).__name__}): {e}")
+        return 1
+
+
+def run_batch(argv: List[str], config) -> int:
+    """
+    Chạy nhiều subcommand trong 1 process (dùng chung connection pool và token)
+    Mỗi dòng của file là 1 lệnh, VD: `schedule --yes --doctor bs.vothie@pdhealth.com`
+    Dòng trống và dòng bắt đầu bằng # được bỏ qua. File `-` đọc từ stdin.
+    """
+    parser = argparse.ArgumentParser(prog="pdhealth batch", description=run_batch.__doc__.strip().splitlines()[0])
+    parser.add_argument("file", help="File chứa danh sách lệnh (`-` = stdin)")
+    parser.add_argument("--stop-on-error", action="store_true", help="Dừng ở lệnh lỗi đầu tiên")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return e.code or 0
+
+    try:
+        if args.file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.file, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        print(f"✗ Không đọc được file batch: {e}")
+        return 2
+
+    failed = 0
+    for line_no, line in enumerate(lines, 1):
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError as e:
+            code = 2
+            print(f"\n✗ [{line_no}] Dòng không hợp lệ ({e}): {line}")
+        else:
+            if not tokens:
+                continue
+            print(f"\n▶ [{line_no}] pdhealth {' '.join(tokens)}")
+            code = run_command(tokens[0], tokens[1:], config)
+
+        if code != 0:
+            failed += 1
+            print(f"✗ [{line_no}] Kết thúc với exit code {code}")
+            if args.stop_on_error:
+                break
+
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Hàm chính"""
+    args = build_parser().parse_args(argv)
+
+    try:
+        config = load_config(env=args.env, base_url=args.base_url, config_path=args.config)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 2
+
+    try:
+        if args.command == "batch":
+            return run_batch(args.args, config)
+        return run_command(args.command, args.args, config)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Đã hủy bởi người dùng\n")
+        return 130
+
+
+def legacy_main(command: str, argv: Optional[List[str]] = None, defaults: Optional[List[str]] = None) -> int:
+    """
+    Điểm vào cho các script cũ (create-doctors.py, ...): tách tùy chọn chung
+    (--env, --base-url, --config) ra khỏi argv và đặt trước tên subcommand
+    `defaults` là tùy chọn chung mặc định của script, bị ghi đè bởi argv
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(add_help=False)
+    add_global_arguments(parser)
+    global_args, rest = parser.parse_known_args(argv)
+
+    options = list(defaults or [])
+    for name in ("env", "base_url", "config"):
+        value = getattr(global_args, name)
+        if value is not None:
+            options += [f"--{name.replace('_', '-')}", value]
+
+    return main(options + [command] + rest)
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Các subcommand của pdhealth (được import lười bởi pdhealth.cli)"""
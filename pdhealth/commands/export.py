@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Xuất cơ sở y tế ra file JSON qua API (tương đương backend/export-facilities.js
+nhưng không cần truy cập trực tiếp database)
+Cùng định dạng và thứ tự osm_id, dùng được ngay cho `pdhealth upload-facilities`
+"""
+
+import json
+
+from pdhealth import api
+from pdhealth.config import DEFAULT_FACILITIES_FILE
+
+
+def add_arguments(parser):
+    parser.add_argument("--output", default=DEFAULT_FACILITIES_FILE,
+                        help=f"File JSON đầu ra (mặc định {DEFAULT_FACILITIES_FILE})")
+    parser.add_argument("--page-size", type=int, default=1000, help="Số cơ sở mỗi trang (mặc định 1000)")
+
+
+def parse_point(wkt):
+    """Đọc WKT `POINT(lng lat)` thành (lng, lat)"""
+    if not wkt or not wkt.startswith("POINT("):
+        return None, None
+    lng, lat = wkt[len("POINT("):-1].split()
+    return float(lng), float(lat)
+
+
+def to_export_row(facility):
+    """Chuyển 1 cơ sở từ GET /facilities sang định dạng của facilities_export.json"""
+    lng, lat = parse_point(facility.get("geom"))
+    return {
+        "osm_id": facility.get("osm_id"),
+        "name": facility.get("name"),
+        "name_en": facility.get("name_en"),
+        "name_vi": facility.get("name_vi"),
+        "healthcare": facility.get("healthcare"),
+        "healthca_1": facility.get("healthca_1"),
+        "amenity": facility.get("amenity"),
+        "building": facility.get("building"),
+        "operator": facility.get("operator"),
+        "capacity": facility.get("capacity"),
+        "addr_full": facility.get("addr_full"),
+        "addr_city": facility.get("addr_city"),
+        "source": facility.get("source"),
+        "osm_type": facility.get("osm_type"),
+        "lng": lng,
+        "lat": lat
+    }
+
+
+def run(args, config) -> int:
+    print(f"📤 Exporting facilities from {config.base_url}...")
+
+    facilities = []
+    page = 1
+    while True:
+        try:
+            response = api.request(config, "GET", "/facilities", params={"page": page, "limit": args.page_size},
+                                   timeout=max(config.timeout, 60))
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+            return 1
+
+        if response.status_code != 200:
+            print(f"❌ Error: {response.status_code} - {response.text[:200]}")
+            return 1
+
+        body = response.json()
+        facilities.extend(to_export_row(f) for f in body.get("data", []) if f.get("geom"))
+        print(f"  → Trang {page}/{body.get('pagination', {}).get('totalPages', '?')}: {len(facilities)} cơ sở")
+
+        if not body.get("pagination", {}).get("hasNext"):
+            break
+        page += 1
+
+    # Giống export-facilities.js: sắp xếp theo osm_id
+    facilities.sort(key=lambda f: int(f["osm_id"]) if f["osm_id"] is not None else -1)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"facilities": facilities}, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Exported {len(facilities)} facilities to {args.output}")
+    return 0
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Liệt kê bác sĩ trong hệ thống (trước đây là list-doctors.py)
+"""
+
+from pdhealth import api
+
+
+def add_arguments(parser):
+    parser.add_argument("--limit", type=int, default=1000, help="Số bác sĩ tối đa (mặc định 1000)")
+    parser.add_argument("--snippet", action="store_true", help="In danh sách email đang active dạng DOCTORS = [...]")
+
+
+def get_all_doctors(config, limit: int):
+    """Lấy danh sách tất cả bác sĩ (None nếu lỗi)"""
+    token = api.login_admin(config)
+    if not token:
+        print(f"❌ Không thể đăng nhập admin ({config.admin_email})")
+        return None
+
+    try:
+        response = api.request(config, "GET", "/users", token=token, params={"role": "doctor", "limit": limit})
+
+        if response.status_code != 200:
+            print(f"❌ Không thể lấy danh sách bác sĩ: {response.text}")
+            return None
+
+        return response.json().get("data", {}).get("users", [])
+
+    except Exception as e:
+        print(f"❌ Lỗi: {str(e)}")
+        return None
+
+
+def run(args, config) -> int:
+    print("🔍 Đang lấy danh sách bác sĩ từ database...\n")
+    doctors = get_all_doctors(config, args.limit)
+    if doctors is None:
+        return 1
+
+    print(f"✅ Tìm thấy {len(doctors)} bác sĩ trong hệ thống\n")
+
+    print("Danh sách bác sĩ:")
+    print("=" * 60)
+    for i, doctor in enumerate(doctors, 1):
+        status = "🟢 Active" if doctor.get("is_active") else "🔴 Inactive"
+        print(f"{i}. {doctor.get('email', 'N/A')} ({doctor.get('id', 'N/A')}) - {status}")
+
+    if args.snippet:
+        print("\n" + "=" * 60)
+        print("DOCTORS = [")
+        for doctor in doctors:
+            if doctor.get("is_active"):
+                print(f'    {{"email": "{doctor.get("email")}", "password": "Doctor123"}},')
+        print("]")
+
+    return 0
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Tạo bác sĩ và xác thực họ (trước đây là create-doctors.py)
+  1. Đăng ký tài khoản doctor
+  2. Đăng nhập và tạo doctor profile
+  3. Admin xác thực (status = approved)
+"""
+
+import time
+from typing import Dict, Optional
+
+from pdhealth import api
+from pdhealth.doctors import select_doctors
+
+
+def add_arguments(parser):
+    parser.add_argument("--doctor", action="append", metavar="EMAIL", help="Chỉ xử lý bác sĩ này (có thể lặp lại)")
+    parser.add_argument("--delay", type=float, default=0.5, help="Số giây nghỉ giữa các request (mặc định 0.5)")
+
+
+def register_doctor(config, doctor: Dict) -> Optional[str]:
+    """Đăng ký tài khoản doctor"""
+    try:
+        response = api.request(config, "POST", "/auth/register", json={
+            "email": doctor["email"],
+            "password": doctor["password"],
+            "role": "doctor"
+        })
+
+        if response.status_code in [200, 201]:
+            data = response.json()
+            if data.get("success"):
+                user_id = data["data"]["user"]["id"]
+                print(f"  ✓ Đăng ký thành công! User ID: {user_id}")
+                return user_id
+
+        print(f"  ✗ Lỗi: {response.status_code} - {response.text}")
+        return None
+
+    except Exception as e:
+        print(f"  ✗ Exception: {str(e)}")
+        return None
+
+
+def create_doctor_profile(config, doctor: Dict, token: str) -> bool:
+    """Tạo doctor profile"""
+    try:
+        response = api.request(config, "POST", "/doctors/profile", token=token, json={
+            "fullName": doctor["fullName"],
+            "specialization": doctor["specialization"],
+            "medicalLicenseId": doctor["medicalLicenseId"],
+            "clinicAddress": doctor["clinicAddress"],
+            "bio": doctor["bio"]
+        })
+
+        if response.status_code in [200, 201]:
+            data = response.json()
+            if data.get("success"):
+                print(f"  ✓ Tạo profile thành công! Status: {data['data']['status']}")
+                return True
+
+        print(f"  ✗ Lỗi tạo profile: {response.status_code} - {response.text}")
+        return False
+
+    except Exception as e:
+        print(f"  ✗ Exception: {str(e)}")
+        return False
+
+
+def verify_doctor(config, user_id: str, admin_token: str) -> bool:
+    """Xác thực doctor bằng admin"""
+    try:
+        response = api.request(config, "PATCH", f"/doctors/{user_id}/verification", token=admin_token, json={
+            "status": "approved",
+            "adminNotes": "Đã xác minh thông tin bác sĩ và giấy phép hành nghề"
+        })
+
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("success"):
+                print(f"  ✓ Xác thực thành công!")
+                return True
+
+        print(f"  ✗ Lỗi xác thực: {response.status_code} - {response.text}")
+        return False
+
+    except Exception as e:
+        print(f"  ✗ Exception: {str(e)}")
+        return False
+
+
+def run(args, config) -> int:
+    doctors = select_doctors(args.doctor)
+    total = len(doctors)
+
+    api.print_section(f"TẠO {total} BÁC SĨ VÀ XÁC THỰC ({config.base_url})")
+
+    # BƯỚC 1: Đăng ký tài khoản doctor
+    api.print_section("BƯỚC 1: ĐĂNG KÝ TÀI KHOẢN DOCTOR")
+
+    registered = []
+    for i, doctor in enumerate(doctors, 1):
+        print(f"[{i}/{total}] Đăng ký: {doctor['fullName']}...")
+        user_id = register_doctor(config, doctor)
+        if user_id:
+            registered.append((doctor, user_id))
+        time.sleep(args.delay)
+
+    print(f"\nĐã đăng ký: {len(registered)}/{total} bác sĩ\n")
+
+    # BƯỚC 2: Login và tạo profile
+    api.print_section("BƯỚC 2: ĐĂNG NHẬP VÀ TẠO PROFILE")
+
+    for i, doctor in enumerate(doctors, 1):
+        print(f"[{i}/{total}] Đăng nhập: {doctor['email']}...")
+        token, _ = api.login(config, doctor["email"], doctor["password"])
+
+        if token:
+            print(f"  → Tạo doctor profile...")
+            create_doctor_profile(config, doctor, token)
+
+        time.sleep(args.delay)
+
+    # BƯỚC 3: Xác thực bằng Admin
+    api.print_section("BƯỚC 3: XÁC THỰC BÁC SĨ (TỰ ĐỘNG BẰNG ADMIN)")
+
+    print("Đăng nhập Admin...")
+    admin_token = api.login_admin(config)
+    failed = 0
+
+    if admin_token:
+        print("\nĐang xác thực các bác sĩ...\n")
+
+        for i, (doctor, user_id) in enumerate(registered, 1):
+            print(f"[{i}/{len(registered)}] Xác thực: {doctor['fullName']}...")
+            if not verify_doctor(config, user_id, admin_token):
+                failed += 1
+            time.sleep(args.delay)
+
+        api.print_section("HOÀN THÀNH!")
+    else:
+        print("\n⚠ Không thể đăng nhập Admin. Bạn cần xác thực thủ công.\n")
+        print("Danh sách User ID cần xác thực:")
+        for i, (doctor, user_id) in enumerate(registered, 1):
+            print(f"{i}. {doctor['fullName']}: {user_id}")
+        failed = len(registered)
+
+    # In thông tin đăng nhập
+    api.print_section("THÔNG TIN ĐĂNG NHẬP")
+
+    for doctor in doctors:
+        print(f"Email: {doctor['email']}")
+        print(f"Password: {doctor['password']}")
+        print(f"Chuyên khoa: {doctor['specialization']}")
+        print("---")
+
+    print("\nLưu ý:")
+    print("- Bác sĩ cần được Admin xác thực (status = approved) mới có thể hoạt động đầy đủ")
+    print("- Kiểm tra danh sách bác sĩ tại: GET /api/doctors")
+    print()
+
+    return 1 if failed else 0
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Tự động tạo lịch cho bác sĩ (trước đây là generate-schedules.py)
+Mỗi ngày tạo 10 slots: 8h, 9h, 10h, 11h, 13h, 14h, 15h, 16h, 19h, 20h
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from pdhealth import api
+from pdhealth.doctors import END_DATE, START_DATE, parse_date, select_doctors
+
+
+def add_arguments(parser):
+    parser.add_argument("--doctor", action="append", metavar="EMAIL", help="Chỉ xử lý bác sĩ này (có thể lặp lại)")
+    parser.add_argument("--start", type=parse_date, default=START_DATE, help="Ngày bắt đầu YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_date, default=END_DATE, help="Ngày kết thúc YYYY-MM-DD (bao gồm)")
+    parser.add_argument("--delay", type=float, default=0.3, help="Số giây nghỉ giữa các ngày (mặc định 0.3)")
+    parser.add_argument("--yes", action="store_true", help="Không hỏi xác nhận (dùng cho cron/batch)")
+
+
+def generate_daily_slots(config, token: str, date: datetime) -> Tuple[bool, any]:
+    """
+    Tạo lịch tự động cho 1 ngày
+    Returns: (success, result)
+    """
+    try:
+        response = api.request(config, "POST", "/appointments/availability/generate-daily", token=token,
+                               json={"date": date.strftime("%Y-%m-%d")})
+
+        # Chấp nhận cả 200 và 201
+        if response.status_code in [200, 201]:
+            data = response.json()
+            if data.get("success"):
+                return True, data.get("data", {}).get("count", 0)
+            return False, data.get("message", "Unknown error")
+
+        # Nếu lỗi 409 có thể là đã tồn tại
+        if response.status_code == 409:
+            return True, "Đã tồn tại"
+
+        try:
+            error_msg = response.json().get("message", f"Error {response.status_code}")
+        except ValueError:
+            error_msg = f"Error {response.status_code}"
+
+        return False, error_msg
+
+    except Exception as e:
+        return False, str(e)
+
+
+def generate_schedule_for_doctor(config, doctor: Dict, start: datetime, end: datetime, delay: float) -> Dict:
+    """
+    Tạo lịch cho 1 bác sĩ
+    Returns: dict với thống kê
+    """
+    name = doctor["fullName"]
+    total_days = (end - start).days + 1
+
+    api.print_section(f"🏥 {name} ({doctor['email']})")
+
+    print(f"  → Đang đăng nhập...")
+    token, user_id = api.login(config, doctor["email"], doctor["password"])
+
+    if not token:
+        print(f"  ✗ Không thể đăng nhập. Bỏ qua bác sĩ này.\n")
+        return {"name": name, "success": False, "total_days": total_days, "success_days": 0,
+                "total_slots": 0, "failed_dates": []}
+
+    print(f"  ✓ Đăng nhập thành công (ID: {user_id})")
+    print(f"  → Tạo lịch cho {total_days} ngày (từ {start.strftime('%d/%m/%Y')} đến {end.strftime('%d/%m/%Y')})\n")
+
+    current_date = start
+    success_days = 0
+    total_slots = 0
+    failed_dates = []
+
+    while current_date <= end:
+        date_str = current_date.strftime("%d/%m/%Y")
+
+        success, result = generate_daily_slots(config, token, current_date)
+
+        if success:
+            success_days += 1
+            if isinstance(result, int):
+                total_slots += result
+                print(f"    ✓ {date_str}: Tạo {result} slots")
+            else:
+                print(f"    ✓ {date_str}: {result}")
+        else:
+            failed_dates.append(date_str)
+            print(f"    ✗ {date_str}: Lỗi - {result}")
+
+        current_date += timedelta(days=1)
+        time.sleep(delay)  # Delay để tránh spam API
+
+    print(f"\n  📊 KẾT QUẢ:")
+    print(f"    - Tổng số ngày: {total_days}")
+    print(f"    - Thành công: {success_days}/{total_days} ngày ({success_days/total_days*100:.1f}%)")
+    print(f"    - Tổng slots đã tạo: {total_slots}")
+
+    if failed_dates:
+        print(f"    - Ngày thất bại: {', '.join(failed_dates[:5])}" + ("..." if len(failed_dates) > 5 else ""))
+
+    return {
+        "name": name,
+        "success": success_days > 0,
+        "total_days": total_days,
+        "success_days": success_days,
+        "total_slots": total_slots,
+        "failed_dates": failed_dates
+    }
+
+
+def run(args, config) -> int:
+    doctors = select_doctors(args.doctor)
+    if args.end < args.start:
+        raise ValueError("Ngày kết thúc phải sau ngày bắt đầu")
+
+    total_days = (args.end - args.start).days + 1
+
+    print(f"\n📡 API Server: {config.base_url}")
+    print(f"📅 Khoảng thời gian: {args.start.strftime('%d/%m/%Y')} - {args.end.strftime('%d/%m/%Y')}")
+    print(f"📆 Tổng số ngày: {total_days} ngày")
+    print(f"👨‍⚕️ Số lượng bác sĩ: {len(doctors)} bác sĩ")
+    print(f"⏱️  Ước tính thời gian: ~{len(doctors) * total_days * (args.delay + 0.2) / 60:.1f} phút")
+
+    if not args.yes:
+        print("\n⚠️  LƯU Ý:")
+        print("  - Mỗi ngày sẽ tạo 10 slots: 8h, 9h, 10h, 11h, 13h, 14h, 15h, 16h, 19h, 20h")
+        print("  - Backend server phải đang chạy")
+        print("  - Tất cả bác sĩ phải đã được xác thực (approved)")
+        input("\n⏎ Nhấn Enter để bắt đầu...")
+
+    results = []
+    start_time = time.time()
+
+    for i, doctor in enumerate(doctors, 1):
+        print(f"\n\n🔄 Đang xử lý {i}/{len(doctors)}...")
+        results.append(generate_schedule_for_doctor(config, doctor, args.start, args.end, args.delay))
+
+    elapsed_time = time.time() - start_time
+
+    api.print_section("🎉 TỔNG KẾT CUỐI CÙNG")
+
+    success_count = sum(1 for r in results if r["success"])
+    total_slots_created = sum(r["total_slots"] for r in results)
+
+    print(f"\n  ✅ Thành công: {success_count}/{len(doctors)} bác sĩ ({success_count/len(doctors)*100:.1f}%)")
+    print(f"  ❌ Thất bại: {len(doctors) - success_count}/{len(doctors)} bác sĩ")
+    print(f"  📊 Tổng số slots đã tạo: {total_slots_created}")
+    print(f"  ⏱️  Thời gian thực hiện: {elapsed_time/60:.1f} phút")
+
+    print("\n  CHI TIẾT TỪNG BÁC SĨ:")
+    for i, result in enumerate(results, 1):
+        status = "✓" if result["success"] else "✗"
+        print(f"    {status} [{i:2d}] {result['name']}: {result['success_days']}/{result['total_days']} ngày, {result['total_slots']} slots")
+
+    print("\n" + "=" * 70 + "\n")
+
+    return 0 if success_count == len(doctors) else 1
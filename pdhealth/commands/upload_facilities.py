@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Upload cơ sở y tế lên server theo batch (trước đây là backend/upload-all-facilities.ps1)
+Batch nhỏ để tránh timeout và giới hạn body size, có retry cho từng batch
+"""
+
+import json
+import time
+
+from pdhealth import api
+from pdhealth.config import DEFAULT_FACILITIES_FILE
+
+
+def add_arguments(parser):
+    parser.add_argument("--file", default=DEFAULT_FACILITIES_FILE,
+                        help=f"File JSON dạng {{\"facilities\": [...]}} (mặc định {DEFAULT_FACILITIES_FILE})")
+    parser.add_argument("--batch-size", type=int, default=200, help="Số cơ sở mỗi batch (mặc định 200)")
+    parser.add_argument("--retries", type=int, default=3, help="Số lần thử cho mỗi batch (mặc định 3)")
+    parser.add_argument("--delay", type=float, default=0.5, help="Số giây nghỉ giữa các batch (mặc định 0.5)")
+
+
+def load_facilities(path: str):
+    """Đọc file JSON dạng {"facilities": [...]} (None nếu file lỗi hoặc sai định dạng)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Cannot read {path}: {e}")
+        return None
+
+    facilities = data.get("facilities") if isinstance(data, dict) else None
+    if not isinstance(facilities, list) or not facilities:
+        print(f"[ERROR] {path} must contain a non-empty \"facilities\" array")
+        return None
+    return facilities
+
+
+def upload_batch(config, token: str, batch, retries: int):
+    """
+    Upload 1 batch, thử lại tối đa `retries` lần
+    Returns: (inserted, skipped) hoặc None nếu thất bại
+    """
+    for attempt in range(1, retries + 1):
+        try:
+            response = api.request(config, "POST", "/seed/facilities", token=token,
+                                   json={"facilities": batch}, timeout=120)
+            if response.status_code in [200, 201]:
+                data = response.json().get("data", {})
+                return data.get("inserted", 0), data.get("skipped", 0)
+            error = f"{response.status_code} - {response.text[:200]}"
+        except Exception as e:
+            error = str(e)
+
+        if attempt < retries:
+            print(f"[RETRY {attempt}/{retries}] ", end="", flush=True)
+            time.sleep(2)
+
+    print(f"[FAIL] {error}")
+    return None
+
+
+def run(args, config) -> int:
+    if args.batch_size < 1:
+        raise ValueError("--batch-size phải lớn hơn 0")
+    if args.retries < 1:
+        raise ValueError("--retries phải lớn hơn 0")
+
+    print(f"\n[START] Uploading facilities to {config.base_url}...")
+
+    # Đọc và kiểm tra file trước khi gọi server
+    print(f"[LOAD] Reading {args.file}...")
+    facilities = load_facilities(args.file)
+    if facilities is None:
+        return 1
+
+    print("[AUTH] Logging in as admin...")
+    token = api.login_admin(config)
+    if not token:
+        print("[ERROR] Login failed")
+        return 1
+
+    total_count = len(facilities)
+    batches = (total_count + args.batch_size - 1) // args.batch_size
+    print(f"[INFO] Total facilities: {total_count}, {batches} batches ({args.batch_size} facilities/batch)\n")
+
+    inserted_count = 0
+    skipped_count = 0
+    failed_count = 0
+
+    for i in range(batches):
+        start_index = i * args.batch_size
+        batch = facilities[start_index:start_index + args.batch_size]
+
+        print(f"[BATCH {i + 1}/{batches}] Uploading facilities {start_index + 1}-{start_index + len(batch)}... ",
+              end="", flush=True)
+
+        result = upload_batch(config, token, batch, args.retries)
+        if result is None:
+            failed_count += len(batch)
+        else:
+            inserted, skipped = result
+            inserted_count += inserted
+            skipped_count += skipped
+            print(f"[OK] Inserted: {inserted}, Skipped: {skipped}")
+
+        if i < batches - 1:
+            time.sleep(args.delay)
+
+    print("\n[VERIFY] Checking database count...")
+    try:
+        response = api.request(config, "GET", "/seed/count", token=token)
+        print(f"[DATABASE] Total facilities in database: {response.json().get('data', {}).get('count')}")
+    except Exception as e:
+        print(f"[WARNING] Could not verify count: {str(e)}")
+
+    print("\n" + "=" * 40)
+    print(f"Total processed: {total_count}")
+    print(f"Successfully inserted: {inserted_count}")
+    print(f"Skipped: {skipped_count}")
+    print(f"Failed: {failed_count}")
+    print("=" * 40 + "\n")
+
+    return 1 if failed_count else 0
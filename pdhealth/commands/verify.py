@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Kiểm tra lịch của các bác sĩ sau khi chạy schedule (trước đây là verify-schedules.py)
+So sánh digest (hash) giờ các slot theo từng ngày thay vì đọc lại từng ngày:
+  - Tính digest mong đợi từ mẫu slot (8h, 9h, 10h, 11h, 13h, 14h, 15h, 16h, 19h, 20h)
+  - Lấy giờ các slot còn trống bằng 1 request available-slots/range và số slot
+    đã đặt bằng 1 request /availability/calendar cho mỗi bác sĩ
+  - Ngày chưa có slot nào được đặt và chưa tới: digest tính từ giờ thực tế
+  - Ngày có slot đã đặt hoặc đã qua (range không trả về các slot này) và ngày
+    bị lệch: gọi /availability/by-date để so sánh giờ từng slot
+"""
+
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from pdhealth import api
+from pdhealth.doctors import DEFAULT_HOURS, END_DATE, START_DATE, parse_date, select_doctors
+
+
+def add_arguments(parser):
+    parser.add_argument("--doctor", action="append", metavar="EMAIL", help="Chỉ kiểm tra bác sĩ này (có thể lặp lại)")
+    parser.add_argument("--start", type=parse_date, default=START_DATE, help="Ngày bắt đầu YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_date, default=END_DATE, help="Ngày kết thúc YYYY-MM-DD (bao gồm)")
+    # Render chạy UTC; dùng để đổi startTime (UTC) sang ngày/giờ của server
+    parser.add_argument("--utc-offset", type=int, default=0, help="Múi giờ của server backend (giờ, mặc định 0)")
+
+
+def day_digest(date_str: str, hours: List[int]) -> str:
+    """Digest của 1 ngày: hash từ ngày và giờ bắt đầu của các slot"""
+    return hashlib.sha1(f"{date_str}:{','.join(str(h) for h in sorted(hours))}".encode("utf-8")).hexdigest()
+
+
+def doctor_digest(day_digests: Dict[str, Optional[str]]) -> str:
+    """Digest của cả lịch bác sĩ: hash các digest theo thứ tự ngày"""
+    h = hashlib.sha1()
+    for date_str in sorted(day_digests):
+        h.update(f"{date_str}={day_digests[date_str]};".encode("utf-8"))
+    return h.hexdigest()
+
+
+def expected_day_digests(start: datetime, end: datetime) -> Dict[str, str]:
+    """Tính digest mong đợi cho từng ngày từ mẫu slot"""
+    digests = {}
+    current_date = start
+    while current_date <= end:
+        date_str = current_date.strftime("%Y-%m-%d")
+        digests[date_str] = day_digest(date_str, DEFAULT_HOURS)
+        current_date += timedelta(days=1)
+    return digests
+
+
+def parse_calendar_date(value: str) -> str:
+    """
+    Chuẩn hóa trường date của /availability/calendar về YYYY-MM-DD
+    Postgres DATE được serialize thành nửa đêm theo giờ server (VD: 2025-11-21T17:00:00.000Z),
+    nên làm tròn về ngày gần nhất
+    """
+    if "T" not in value:
+        return value[:10]
+    parsed = datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
+    return (parsed + timedelta(hours=12)).strftime("%Y-%m-%d")
+
+
+def slot_time(start_time: str, utc_offset: int) -> datetime:
+    """Đổi startTime dạng ISO UTC sang giờ của server"""
+    parsed = datetime.strptime(start_time[:19], "%Y-%m-%dT%H:%M:%S")
+    return parsed + timedelta(hours=utc_offset)
+
+
+def server_today(utc_offset: int) -> str:
+    """Ngày hiện tại theo giờ server (YYYY-MM-DD)"""
+    return (datetime.now(timezone.utc) + timedelta(hours=utc_offset)).strftime("%Y-%m-%d")
+
+
+def date_range_params(start: datetime, end: datetime) -> Dict[str, str]:
+    """Tham số startDate/endDate cho API (endDate là cận trên không bao gồm)"""
+    return {
+        "startDate": start.strftime("%Y-%m-%d"),
+        "endDate": (end + timedelta(days=1)).strftime("%Y-%m-%d")
+    }
+
+
+def fetch_booked_counts(config, token: str, start: datetime, end: datetime) -> Optional[Dict[str, Tuple[int, int]]]:
+    """
+    Lấy số slot theo ngày bằng 1 request /availability/calendar
+    Returns: {ngày: (tổng số slot, số slot đã đặt)}
+    """
+    try:
+        response = api.request(config, "GET", "/appointments/availability/calendar", token=token,
+                               params=date_range_params(start, end), timeout=max(config.timeout, 30))
+
+        if response.status_code != 200:
+            print(f"    ✗ Lỗi lấy calendar: {response.status_code} - {response.text[:100]}")
+            return None
+
+        counts = {}
+        for day in response.json().get("data", {}).get("dates", []):
+            date_str = parse_calendar_date(str(day.get("date")))
+            counts[date_str] = (int(day.get("totalSlots", 0)), int(day.get("bookedSlots", 0)))
+        return counts
+
+    except Exception as e:
+        print(f"    ✗ Lỗi lấy calendar: {str(e)}")
+        return None
+
+
+def fetch_available_hours(config, user_id: str, start: datetime, end: datetime,
+                          utc_offset: int) -> Optional[Dict[str, List[int]]]:
+    """Lấy giờ các slot còn trống (chưa đặt, chưa qua) theo ngày bằng 1 request available-slots/range"""
+    try:
+        response = api.request(config, "GET", f"/appointments/doctors/{user_id}/available-slots/range",
+                               params=date_range_params(start, end), timeout=max(config.timeout, 30))
+
+        if response.status_code != 200:
+            print(f"    ✗ Lỗi lấy available-slots: {response.status_code} - {response.text[:100]}")
+            return None
+
+        hours = {}
+        for slot in response.json().get("data", {}).get("slots", []):
+            local = slot_time(slot["startTime"], utc_offset)
+            hours.setdefault(local.strftime("%Y-%m-%d"), []).append(local.hour)
+        return hours
+
+    except Exception as e:
+        print(f"    ✗ Lỗi lấy available-slots: {str(e)}")
+        return None
+
+
+def actual_day_digests(counts: Dict[str, Tuple[int, int]], available: Dict[str, List[int]],
+                       today: str) -> Dict[str, Optional[str]]:
+    """
+    Digest thực tế theo ngày
+    None nếu không tính được từ range (ngày đã có slot được đặt, hoặc hôm nay/đã qua)
+    """
+    digests = {}
+    for date_str, (_, booked) in counts.items():
+        if booked == 0 and date_str > today:
+            digests[date_str] = day_digest(date_str, available.get(date_str, []))
+        else:
+            digests[date_str] = None
+    return digests
+
+
+def fetch_day_hours(config, token: str, date_str: str, utc_offset: int) -> Optional[List[int]]:
+    """Lấy danh sách giờ của tất cả slot trong 1 ngày (chỉ dùng cho ngày cần kiểm tra chi tiết)"""
+    try:
+        response = api.request(config, "GET", "/appointments/availability/by-date", token=token,
+                               params={"date": date_str})
+
+        if response.status_code != 200:
+            return None
+
+        slots = response.json().get("data", {}).get("slots", [])
+        return sorted(slot_time(slot["startTime"], utc_offset).hour for slot in slots)
+
+    except Exception:
+        return None
+
+
+def describe_mismatch(hours: Optional[List[int]]) -> str:
+    """Mô tả chênh lệch giữa các giờ thực tế và mẫu slot"""
+    if hours is None:
+        return "không lấy được chi tiết"
+    missing = [h for h in DEFAULT_HOURS if h not in hours]
+    extra = [h for h in hours if h not in DEFAULT_HOURS]
+    parts = [f"{len(hours)}/{len(DEFAULT_HOURS)} slots"]
+    if missing:
+        parts.append("thiếu " + ", ".join(f"{h}h" for h in missing))
+    if extra:
+        parts.append("thừa " + ", ".join(f"{h}h" for h in extra))
+    return " - ".join(parts)
+
+
+def verify_doctor(config, doctor: Dict, args, expected: Dict[str, str], expected_root: str) -> Tuple[bool, int, int]:
+    """
+    Kiểm tra lịch của 1 bác sĩ
+    Returns: (ok, số ngày lệch, số request đã gọi)
+    """
+    api.print_section(f"🏥 {doctor['fullName']} ({doctor['email']})")
+
+    # Chỉ đếm request đăng nhập khi thực sự gửi (batch dùng lại token đã cache)
+    requests_made = 0 if api.has_cached_token(config, doctor["email"]) else 1
+    token, user_id = api.login(config, doctor["email"], doctor["password"])
+    if not token:
+        return False, len(expected), requests_made
+
+    counts = fetch_booked_counts(config, token, args.start, args.end)
+    requests_made += 1
+    if counts is None:
+        return False, len(expected), requests_made
+
+    available = fetch_available_hours(config, user_id, args.start, args.end, args.utc_offset)
+    requests_made += 1
+    if available is None:
+        return False, len(expected), requests_made
+
+    actual = actual_day_digests(counts, available, server_today(args.utc_offset))
+    if doctor_digest(actual) == expected_root:
+        print(f"  ✓ Khớp giờ các slot của toàn bộ {len(expected)} ngày")
+        return True, 0, requests_made
+
+    # Ngày lệch hoặc chưa tính được digest: so sánh giờ từng slot
+    to_check = sorted(
+        date_str for date_str in set(expected) | set(actual)
+        if expected.get(date_str) != actual.get(date_str)
+    )
+    print(f"  → Kiểm tra chi tiết {len(to_check)}/{len(expected)} ngày...")
+
+    mismatched = 0
+    for date_str in to_check:
+        hours = fetch_day_hours(config, token, date_str, args.utc_offset)
+        requests_made += 1
+        if hours is not None and expected.get(date_str) == day_digest(date_str, hours):
+            continue
+        mismatched += 1
+        print(f"    ✗ {date_str}: {describe_mismatch(hours)}")
+
+    if mismatched == 0:
+        print(f"  ✓ Khớp giờ các slot của toàn bộ {len(expected)} ngày")
+    else:
+        print(f"  ✗ Lệch {mismatched}/{len(expected)} ngày")
+    return mismatched == 0, mismatched, requests_made
+
+
+def run(args, config) -> int:
+    doctors = select_doctors(args.doctor)
+    if args.end < args.start:
+        raise ValueError("Ngày kết thúc phải sau ngày bắt đầu")
+
+    print(f"\n📡 API Server: {config.base_url}")
+    print(f"📅 Khoảng thời gian: {args.start.strftime('%d/%m/%Y')} - {args.end.strftime('%d/%m/%Y')}")
+    print(f"👨‍⚕️ Số lượng bác sĩ: {len(doctors)} bác sĩ")
+    print(f"🔍 So sánh giờ từng slot với mẫu: {', '.join(f'{h}h' for h in DEFAULT_HOURS)}")
+
+    expected = expected_day_digests(args.start, args.end)
+    expected_root = doctor_digest(expected)
+
+    results = []
+    total_requests = 0
+    start_time = time.time()
+
+    for doctor in doctors:
+        ok, mismatched_days, requests_made = verify_doctor(config, doctor, args, expected, expected_root)
+        results.append((doctor["fullName"], ok, mismatched_days))
+        total_requests += requests_made
+
+    elapsed_time = time.time() - start_time
+    baseline_requests = len(doctors) * (len(expected) + 1)
+
+    api.print_section("📊 TỔNG KẾT")
+
+    ok_count = sum(1 for _, ok, _ in results if ok)
+    print(f"\n  ✅ Khớp: {ok_count}/{len(doctors)} bác sĩ")
+    print(f"  ❌ Lệch: {len(doctors) - ok_count}/{len(doctors)} bác sĩ")
+    print(f"  📡 Số request: {total_requests} (kiểm tra từng ngày cần ~{baseline_requests})")
+    print(f"  ⏱️  Thời gian thực hiện: {elapsed_time:.1f} giây")
+
+    for i, (name, ok, mismatched_days) in enumerate(results, 1):
+        status = "✓" if ok else "✗"
+        detail = "OK" if ok else f"{mismatched_days} ngày lệch"
+        print(f"    {status} [{i:2d}] {name}: {detail}")
+
+    print("\n" + "=" * 70 + "\n")
+
+    return 0 if ok_count == len(doctors) else 1
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Cấu hình dùng chung cho mọi subcommand: môi trường, BASE_URL, tài khoản admin
+
+Thứ tự ưu tiên: tham số dòng lệnh > biến môi trường > file cấu hình > mặc định
+  - Biến môi trường: PDHEALTH_ENV, PDHEALTH_BASE_URL, PDHEALTH_ADMIN_EMAIL,
+    PDHEALTH_ADMIN_PASSWORD, PDHEALTH_TIMEOUT, PDHEALTH_CONFIG
+  - File cấu hình (JSON, mặc định ./pdhealth.json):
+    {"env": "local", "environments": {"staging": {"base_url": "...", "admin_email": "...", "admin_password": "..."}}}
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+ENVIRONMENTS = {
+    "production": {
+        "base_url": "https://be-healthcareapppd.onrender.com/api",
+        "admin_email": "admin@healthcare.com",
+        "admin_password": "Admin123456"
+    },
+    "local": {
+        "base_url": "http://localhost:5000/api",
+        "admin_email": "admin@example.com",
+        "admin_password": "Admin123"
+    }
+}
+
+DEFAULT_ENV = "production"
+DEFAULT_CONFIG_FILE = "pdhealth.json"
+DEFAULT_TIMEOUT = 10
+
+# File JSON cơ sở y tế dùng chung cho export và upload-facilities
+DEFAULT_FACILITIES_FILE = "backend/facilities_export.json"
+
+
+class Config:
+    """Cấu hình đã được giải quyết cho 1 lần chạy"""
+
+    def __init__(self, env: str, base_url: str, admin_email: str, admin_password: str, timeout: float):
+        self.env = env
+        self.base_url = base_url.rstrip("/")
+        self.admin_email = admin_email
+        self.admin_password = admin_password
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"Config(env={self.env!r}, base_url={self.base_url!r}, admin_email={self.admin_email!r})"
+
+
+def _read_config_file(path: Optional[str]) -> Dict:
+    """Đọc file cấu hình JSON; không có file mặc định thì bỏ qua"""
+    explicit = path or os.environ.get("PDHEALTH_CONFIG")
+    path = explicit or DEFAULT_CONFIG_FILE
+    if not os.path.exists(path):
+        if explicit:
+            raise ValueError(f"Không tìm thấy file cấu hình: {path}")
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Không đọc được file cấu hình {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise ValueError(f"File cấu hình {path} phải là 1 object JSON")
+    environments = data.get("environments", {})
+    if not isinstance(environments, dict) or not all(isinstance(v, dict) for v in environments.values()):
+        raise ValueError(f"File cấu hình {path}: \"environments\" phải là object dạng {{tên: {{...}}}}")
+    return data
+
+
+def load_config(env: Optional[str] = None, base_url: Optional[str] = None,
+                config_path: Optional[str] = None) -> Config:
+    """Gộp tham số dòng lệnh, biến môi trường và file cấu hình thành Config"""
+    file_config = _read_config_file(config_path)
+
+    env = env or os.environ.get("PDHEALTH_ENV") or file_config.get("env") or DEFAULT_ENV
+
+    environments = dict(ENVIRONMENTS)
+    for name, values in file_config.get("environments", {}).items():
+        environments[name] = {**environments.get(name, {}), **values}
+
+    if env not in environments:
+        raise ValueError(f"Môi trường không hợp lệ: {env} (có: {', '.join(sorted(environments))})")
+    settings = environments[env]
+
+    base_url = base_url or os.environ.get("PDHEALTH_BASE_URL") or settings.get("base_url")
+    if not base_url:
+        raise ValueError(f"Chưa cấu hình base_url cho môi trường: {env}")
+
+    return Config(
+        env=env,
+        base_url=base_url,
+        admin_email=os.environ.get("PDHEALTH_ADMIN_EMAIL") or settings.get("admin_email", ""),
+        admin_password=os.environ.get("PDHEALTH_ADMIN_PASSWORD") or settings.get("admin_password", ""),
+        timeout=float(os.environ.get("PDHEALTH_TIMEOUT") or settings.get("timeout", DEFAULT_TIMEOUT))
+    )
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Dữ liệu dùng chung: danh sách 10 bác sĩ mẫu và mẫu lịch làm việc
+"""
+
+from datetime import datetime
+
+# Khoảng ngày tạo lịch mặc định
+START_DATE = datetime(2025, 11, 22)
+END_DATE = datetime(2026, 1, 1)
+
+# Mẫu slot giống backend (appointmentRepository.generateDailySlots)
+DEFAULT_HOURS = [8, 9, 10, 11, 13, 14, 15, 16, 19, 20]
+
+DOCTORS = [
+    {
+        "email": "bs.nguyenvana@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Nguyễn Văn A",
+        "specialization": "Nội khoa",
+        "medicalLicenseId": "BS001234",
+        "clinicAddress": "Bệnh viện Đa khoa Trung ương, TP.HCM",
+        "bio": "Bác sĩ chuyên khoa nội với 15 năm kinh nghiệm"
+    },
+    {
+        "email": "bs.tranthib@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Trần Thị B",
+        "specialization": "Nhi khoa",
+        "medicalLicenseId": "BS001235",
+        "clinicAddress": "Bệnh viện Nhi Đồng 1, TP.HCM",
+        "bio": "Bác sĩ nhi khoa với 10 năm kinh nghiệm điều trị bệnh nhi"
+    },
+    {
+        "email": "bs.lequangc@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Lê Quang C",
+        "specialization": "Tim mạch",
+        "medicalLicenseId": "BS001236",
+        "clinicAddress": "Bệnh viện Tim Tâm Đức, TP.HCM",
+        "bio": "Chuyên gia tim mạch với 20 năm kinh nghiệm"
+    },
+    {
+        "email": "bs.phamhoaid@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Phạm Hoài D",
+        "specialization": "Da liễu",
+        "medicalLicenseId": "BS001237",
+        "clinicAddress": "Bệnh viện Da liễu TP.HCM",
+        "bio": "Bác sĩ da liễu chuyên điều trị mụn và các bệnh về da"
+    },
+    {
+        "email": "bs.vothie@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Võ Thị E",
+        "specialization": "Sản phụ khoa",
+        "medicalLicenseId": "BS001238",
+        "clinicAddress": "Bệnh viện Từ Dũ, TP.HCM",
+        "bio": "Bác sĩ sản phụ khoa với 12 năm kinh nghiệm"
+    },
+    {
+        "email": "bs.ngominhf@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Ngô Minh F",
+        "specialization": "Ngoại khoa",
+        "medicalLicenseId": "BS001239",
+        "clinicAddress": "Bệnh viện Chợ Rẫy, TP.HCM",
+        "bio": "Bác sĩ ngoại khoa tổng quát với 18 năm kinh nghiệm"
+    },
+    {
+        "email": "bs.doantuang@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Đoàn Tuấn G",
+        "specialization": "Tai mũi họng",
+        "medicalLicenseId": "BS001240",
+        "clinicAddress": "Bệnh viện Tai Mũi Họng TP.HCM",
+        "bio": "Chuyên khoa Tai Mũi Họng với 8 năm kinh nghiệm"
+    },
+    {
+        "email": "bs.buikimh@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Bùi Kim H",
+        "specialization": "Mắt",
+        "medicalLicenseId": "BS001241",
+        "clinicAddress": "Bệnh viện Mắt TP.HCM",
+        "bio": "Bác sĩ chuyên khoa mắt, chuyên điều trị cận thị và đục thủy tinh thể"
+    },
+    {
+        "email": "bs.hoangdungi@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Hoàng Dũng I",
+        "specialization": "Thần kinh",
+        "medicalLicenseId": "BS001242",
+        "clinicAddress": "Bệnh viện 115, TP.HCM",
+        "bio": "Bác sĩ thần kinh với 14 năm kinh nghiệm điều trị đột quỵ và bệnh Parkinson"
+    },
+    {
+        "email": "bs.dinhhank@pdhealth.com",
+        "password": "Doctor123",
+        "fullName": "BS. Đinh Hân K",
+        "specialization": "Răng hàm mặt",
+        "medicalLicenseId": "BS001243",
+        "clinicAddress": "Bệnh viện Răng Hàm Mặt TP.HCM",
+        "bio": "Nha sĩ với 10 năm kinh nghiệm điều trị và thẩm mỹ răng"
+    }
+]
+
+
+def select_doctors(emails=None):
+    """Lọc danh sách bác sĩ theo email (None = tất cả)"""
+    if not emails:
+        return DOCTORS
+    selected = [d for d in DOCTORS if d["email"] in emails]
+    unknown = set(emails) - {d["email"] for d in selected}
+    if unknown:
+        raise ValueError(f"Không có bác sĩ với email: {', '.join(sorted(unknown))}")
+    return selected
+
+
+def parse_date(value: str) -> datetime:
+    """Đọc ngày dạng YYYY-MM-DD (dùng cho argparse)"""
+    return datetime.strptime(value, "%Y-%m-%d")
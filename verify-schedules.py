@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script kiểm tra lịch bác sĩ bằng digest theo ngày
+Giữ lại để tương thích, tương đương: python -m pdhealth verify
+Nhận cả tùy chọn chung (--env, --base-url, --config) ở bất kỳ vị trí nào
+"""
+
+import sys
+
+from pdhealth.cli import legacy_main
+
+if __name__ == "__main__":
+    sys.exit(legacy_main("verify"))